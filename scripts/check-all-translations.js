@@ -5,15 +5,78 @@
  * 2. Diet programs from database (all languages)
  * 3. Lifestyle programs from database (all languages)
  * 4. Code usage - finds places where keys might be displayed instead of translations
+ *
+ * Usage:
+ *   node scripts/check-all-translations.js          # human-readable report
+ *   node scripts/check-all-translations.js --json   # JSON Lines issues on stdout,
+ *                                                   # progress/report on stderr
  */
 
 const fs = require('fs');
 const path = require('path');
+const { isMainThread, parentPort, workerData } = require('worker_threads');
+const { getKeys, MISSING, getValueAtPath, readLocaleFile } = require('./i18n-locale-utils');
+const { PARALLEL_SCAN_MIN_FILES, runInWorkers } = require('./scan-workers');
 
 const LOCALES_DIR = path.join(__dirname, '../apps/mobile/app/i18n/locales');
+const EN_LOCALE_PATH = path.join(LOCALES_DIR, 'en.json');
 const TARGET_LOCALES = ['ru', 'kk', 'fr'];
 const REQUIRED_LOCALES = ['en', 'ru', 'kk', 'fr'];
 
+// With --json, stdout carries one JSON record per issue for downstream tooling,
+// so the human-readable output moves to stderr
+const JSON_OUTPUT = process.argv.includes('--json');
+const log = JSON_OUTPUT ? console.error : console.log;
+
+// Directories never worth scanning for UI strings (dot-directories such as
+// .git/.expo/.next are skipped separately)
+const SKIP_DIRS = new Set([
+    'node_modules', '__tests__', 'ios', 'android', 'build', 'dist', 'coverage',
+]);
+
+// Which file names the code scan reads, decided once per directory entry
+// during the walk: JS/TS sources, minus tests/specs and generated/minified
+// bundles (never hand-written UI code)
+const SOURCE_FILE_RE = /\.(?:js|ts|tsx)$/;
+const EXCLUDED_FILE_RE = /\.(?:test|spec)\.|\.(?:min|bundle)\.js$/;
+const MAX_SCAN_FILE_SIZE = 512 * 1024;
+
+// One read buffer per thread, reused for every scanned file. Files above
+// MAX_SCAN_FILE_SIZE are skipped, so it never needs to grow.
+const scanBuffer = Buffer.allocUnsafe(MAX_SCAN_FILE_SIZE);
+
+// Patterns used by the per-line code scan, compiled once instead of per line
+const FRENCH_ACTION_WORD_RE = /^[A-ZÉÈÊÀÂÔÛÙÇ][a-zéèêàâôûùçéèêàâôûùïî\s]+\.\.\.$/;
+// import ... / ... from '...' / require('...') in a single pass
+const MODULE_LINE_RE = /^\s*import\s|\bfrom\s+['"]|\brequire\(\s*['"]/;
+const LOCALE_LITERAL_RE = /^\s*(en|ru|kk|fr|de|es):\s*['"]/;
+const T_KEY_RE = /\b(?:t|safeT)\(\s*['"]([^'"]+)['"]/;
+// \n-style escapes, \xHH and \uHHHH in a single pass
+const ESCAPE_SEQUENCE_RE = /^\\[nrtbfv'"\\0]|^\\x[0-9a-fA-F]{2}$|^\\u[0-9a-fA-F]{4}$/;
+const UI_TEXT_RE = /['"](Save|Cancel|Delete|Edit|Close|Back|Next|Continue|Loading|Error|Success|Try Again|Share|Correct)[^'"]*['"]/;
+// UI text used as a fallback on either side of `||`, in a single pass
+const UI_TEXT_FALLBACK_RE = /['"](?:Save|Cancel|Delete|Edit|Close|Back|Next|Continue|Loading|Error|Success|Try Again|Share|Correct)[^'"]*['"]\s*\|\||\|\|\s*['"](?:Save|Cancel|Delete|Edit|Close|Back|Next|Continue|Loading|Error|Success|Try Again|Share|Correct)[^'"]*['"]/;
+
+// Helper: One regex matching any of the given literal substrings, so a line is
+// searched once instead of once per `line.includes(...)`
+function anySubstringRe(substrings) {
+    return new RegExp(substrings.map(s => s.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'));
+}
+
+const FALLBACK_LINE_RE = anySubstringRe(['Fallback:', 'titleFallback', 'descFallback', 'actionFallback', 't = (key) =>']);
+const TEST_CALL_RE = anySubstringRe(['test(', 'it(', 'describe(', 'expect(', 'render(', 'screen.']);
+const ACCESSIBILITY_ATTR_RE = anySubstringRe(['accessibilityLabel', 'accessibilityHint', 'testID', 'accessibilityRole']);
+const ERROR_HANDLING_RE = anySubstringRe(['console.', 'catch', 'throw']);
+
+// Whole-file alternation of T_KEY_RE | UI_TEXT_RE used to find candidate lines
+// in a single pass. Character classes exclude '\n' so a match never spans two
+// lines, and any line either pattern matches on gets at least one match.
+// It runs over a latin1 view of the bytes, where T_KEY_RE's `\s*` can't see
+// non-ASCII whitespace (NBSP is C2 A0, U+2009 is E2 80 89, ...), so a `t(`
+// followed by any non-ASCII byte also makes its line a candidate; the
+// decoded-line check then decides exactly as before.
+const CANDIDATE_SCAN_RE = /\b(?:t|safeT)\([^\S\n]*(?:['"][^'"\n]+['"]|[\x80-\xff])|['"](?:Save|Cancel|Delete|Edit|Close|Back|Next|Continue|Loading|Error|Success|Try Again|Share|Correct)[^'"\n]*['"]/g;
+
 const ALLOWED_SAME_AS_ENGLISH = new Set([
     'EatSense', 'OK', 'Email', 'ID', 'v1.0', 'All', 'Auto', 'Snack',
     'Premium', 'Pro', 'Free', 'Articles', 'Article', 'calories', 'kcal',
@@ -45,28 +108,72 @@ const ALLOWED_SAME_AS_ENGLISH = new Set([
     'Social', 'Old Money', 'Hot Girl Walk', 'Summer Shred', 'Mob Wife', 'Soft Life', 'Portions', 'Liraglutide',
 ]);
 
-// Helper: Get all keys from nested object
-function getKeys(obj, prefix = '') {
-    return Object.keys(obj).reduce((acc, key) => {
-        const value = obj[key];
-        const fullKey = prefix ? `${prefix}.${key}` : key;
-        if (value && typeof value === 'object' && !Array.isArray(value)) {
-            acc.push(...getKeys(value, fullKey));
+// Helper: Offsets at which each line of `buf` starts. Buffer#indexOf
+// searches the raw bytes natively (memchr-style), no string involved.
+function getLineStarts(buf) {
+    const starts = [0];
+    let idx = buf.indexOf(0x0a);
+    while (idx !== -1) {
+        starts.push(idx + 1);
+        idx = buf.indexOf(0x0a, idx + 1);
+    }
+    return starts;
+}
+
+// Helper: Zero-based line index containing `offset` (binary search over line starts)
+function lineIndexAt(lineStarts, offset) {
+    let lo = 0;
+    let hi = lineStarts.length - 1;
+    while (lo < hi) {
+        const mid = (lo + hi + 1) >> 1;
+        if (lineStarts[mid] <= offset) {
+            lo = mid;
         } else {
-            acc.push(fullKey);
+            hi = mid - 1;
         }
-        return acc;
-    }, []);
+    }
+    return lo;
+}
+
+// Helper: Read up to `size` bytes of an open file into scanBuffer, returns bytes read
+function readIntoScanBuffer(fd, size) {
+    let offset = 0;
+    while (offset < size) {
+        const bytesRead = fs.readSync(fd, scanBuffer, offset, size - offset, offset);
+        if (bytesRead === 0) break;
+        offset += bytesRead;
+    }
+    return offset;
 }
 
-// Helper: Get value from nested object by key path
-function getValue(obj, key) {
-    return key.split('.').reduce((o, i) => (o ? o[i] : undefined), obj);
+// Helper: Every key path in a locale object (branches and leaves, array
+// items included), so presence checks become a Set lookup. Only own keys of
+// the JSON objects count: unlike the old property walk, inherited or string
+// properties (`constructor`, `toString`, `common.save.length`) are
+// deliberately no longer treated as existing translation keys.
+function getKeyPaths(obj, prefix = '', paths = new Set()) {
+    for (const key of Object.keys(obj)) {
+        const fullKey = prefix ? `${prefix}.${key}` : key;
+        paths.add(fullKey);
+        const value = obj[key];
+        if (value && typeof value === 'object') {
+            getKeyPaths(value, fullKey, paths);
+        }
+    }
+    return paths;
 }
 
-// Helper: Check if key exists in object
-function hasKey(obj, key) {
-    return getValue(obj, key) !== undefined;
+// Key path sets per parsed locale object, built on first use
+const keyPathCache = new WeakMap();
+
+// Helper: Cached getKeyPaths for a locale object returned by readLocaleFile
+function getLocaleKeyPaths(content) {
+    let paths = keyPathCache.get(content);
+    if (!paths) {
+        paths = getKeyPaths(content);
+        keyPathCache.set(content, paths);
+    }
+    return paths;
 }
 
 // Check if value looks like a translation key (e.g., "common.save" or "onboarding.welcome")
@@ -77,7 +184,7 @@ function looksLikeKey(value) {
     // These are valid translations, not keys (e.g., "Chargement..." = "Loading...")
     // Pattern: Capital letter, French letters, ends with "..."
     // Also allow spaces for phrases like "Rechercher des régimes..."
-    if (value.endsWith('...') && /^[A-ZÉÈÊÀÂÔÛÙÇ][a-zéèêàâôûùçéèêàâôûùïî\s]+\.\.\.$/.test(value)) {
+    if (value.endsWith('...') && FRENCH_ACTION_WORD_RE.test(value)) {
         return false; // French loading text like "Chargement..." is valid
     }
     
@@ -94,42 +201,44 @@ function looksLikeKey(value) {
 
 // Check JSON translation files
 function checkJsonTranslations() {
-    console.log('📋 Checking JSON translation files...\n');
+    log('📋 Checking JSON translation files...\n');
     
-    const enPath = path.join(LOCALES_DIR, 'en.json');
-    if (!fs.existsSync(enPath)) {
+    const enContent = readLocaleFile(EN_LOCALE_PATH);
+    if (!enContent) {
         console.error('❌ English translation file not found!');
         return { issues: [], totalIssues: 0 };
     }
     
-    const enContent = JSON.parse(fs.readFileSync(enPath, 'utf8'));
     const enKeys = getKeys(enContent);
+    // Split each key path and resolve its English value once for all locales
+    const enEntries = enKeys.map(key => {
+        const parts = key.split('.');
+        return { key, parts, enValue: getValueAtPath(enContent, parts) };
+    });
     
-    console.log(`📊 Total keys in English: ${enKeys.length}\n`);
+    log(`📊 Total keys in English: ${enKeys.length}\n`);
     
     const allIssues = [];
     
     TARGET_LOCALES.forEach(locale => {
         const localePath = path.join(LOCALES_DIR, `${locale}.json`);
-        if (!fs.existsSync(localePath)) {
-            console.log(`❌ ${locale.toUpperCase()}: File not found\n`);
+        const localeContent = readLocaleFile(localePath);
+        if (!localeContent) {
+            log(`❌ ${locale.toUpperCase()}: File not found\n`);
             allIssues.push({ locale, type: 'missing_file', keys: [] });
             return;
         }
         
-        const localeContent = JSON.parse(fs.readFileSync(localePath, 'utf8'));
         const missing = [];
         const empty = [];
         const untranslated = [];
         const keyLikeValues = []; // Values that look like translation keys
         
-        enKeys.forEach(key => {
-            if (!hasKey(localeContent, key)) {
+        enEntries.forEach(({ key, parts, enValue }) => {
+            const value = getValueAtPath(localeContent, parts);
+            if (value === MISSING) {
                 missing.push(key);
             } else {
-                const value = getValue(localeContent, key);
-                const enValue = getValue(enContent, key);
-                
                 if (value === '' || value === null || value === undefined) {
                     empty.push(key);
                 } else if (typeof value === 'string') {
@@ -137,7 +246,7 @@ function checkJsonTranslations() {
                     // These are valid translations, not keys (e.g., "Chargement..." = "Loading...")
                     // Pattern: Capital letter, French letters, ends with "..."
                     const isFrenchActionWord = value.endsWith('...') && 
-                        /^[A-ZÉÈÊÀÂÔÛÙÇ][a-zéèêàâôûùçéèêàâôûùïî\s]+\.\.\.$/.test(value);
+                        FRENCH_ACTION_WORD_RE.test(value);
                     
                     // FIX: Also check if English value also ends with "..." - then it's a loading text, not a key
                     // This covers cases like "Loading..." -> "Chargement..." or "Searching..." -> "Recherche..."
@@ -151,33 +260,7 @@ function checkJsonTranslations() {
                         keyLikeValues.push({ key, value });
                     } else if (value === enValue && value.length > 3 && !isFrenchActionWord && !isBothLoadingText) {
                         // Check if it's not a brand name or common term
-                        const ignoreList = [
-                            'EatSense', 'OK', 'Email', 'ID', 'v1.0', 'All', 'Auto', 'Snack',
-                            'Premium', 'Pro', 'Free', 'Articles', 'Article', 'calories', 'kcal',
-                            'Total', 'Dashboard', 'Profile', 'Settings', 'Cancel', 'Save', 'Delete',
-                            'Edit', 'Close', 'Back', 'Next', 'Skip', 'Done', 'Loading', 'Error',
-                            'Success', 'Retry', 'Search', 'View All', 'Yes', 'No', 'Confirm', 'Info',
-                            'Days', 'Of', 'Coming Soon', 'Continue', 'Show', 'Hide', 'Hours', 'Stop',
-                            'Go Back', 'Go To', 'Days Ago', 'Free', 'Got It', 'Later', 'Other', 'Yesterday',
-                            'Notifications', 'Student', 'Founder', 'Chat', 'Expert', 'Client', 'Consultation',
-                            'Description', 'Spam', 'Pause', 'Contact', 'Title', 'Link', 'Excellent',
-                            'Performance', 'Required', 'Grant Access', 'Enabled', 'Not Enabled', 'Enable Failed',
-                            'Vintage', 'Destinations', 'Modal Title', 'Diets', 'Experts', 'Reports',
-                            'Calories', 'Zoom Label', 'Flash Mode Auto', 'Flash auto', 'Flash automatique',
-                            'Today', 'Empty', 'Times', 'Period', 'Adherence', 'Conclusions', 'On Track',
-                            'Over', 'Under', 'Subtitle', 'Download Current', 'History', 'Downloaded',
-                            'No Data For Month', 'Delete Confirm', 'File Saved', 'Privacy Title',
-                            'Terms Title', 'Privacy Link', 'Terms Link', 'Tab Title', 'Load', 'Save',
-                            'Delete', 'Name Required', 'No Doses', 'Edit', 'Add', 'Delete Message',
-                            'Name', 'Dosage', 'Instructions', 'Start Date', 'End Date', 'Timezone', 'Doses',
-                            'Before Meal', 'After Meal', 'Add Dose', 'Health Score Label',
-                            'Daily Limit Reached', 'No Data Today', 'Unnamed Product', 'Chronotype',
-                            'Inflammation', 'Suggestions', 'Nutrition', 'Support', 'Assistance',
-                            'Medications', 'Médicaments', 'Medication schedule', 'Planning des médicaments',
-                            '500 mg', 'Zoom {{value}}x', 'Calories (kcal)', 'EatSense Pro', 'EatSense Premium',
-                            '9. Contact', '10. Contact', 'Horaires', 'Times'
-                        ];
-                        if (!ignoreList.includes(value) && !ALLOWED_SAME_AS_ENGLISH.has(value)) {
+                        if (!ALLOWED_SAME_AS_ENGLISH.has(value)) {
                             untranslated.push(key);
                         }
                     }
@@ -186,27 +269,27 @@ function checkJsonTranslations() {
         });
         
         if (missing.length > 0 || empty.length > 0 || untranslated.length > 0 || keyLikeValues.length > 0) {
-            console.log(`📋 ${locale.toUpperCase()} Issues:`);
+            log(`📋 ${locale.toUpperCase()} Issues:`);
             if (missing.length > 0) {
-                console.log(`  ❌ Missing keys (${missing.length}):`);
-                missing.slice(0, 20).forEach(key => console.log(`     - ${key}`));
-                if (missing.length > 20) console.log(`     ... and ${missing.length - 20} more`);
+                log(`  ❌ Missing keys (${missing.length}):`);
+                log(missing.slice(0, 20).map(key => `     - ${key}`).join('\n'));
+                if (missing.length > 20) log(`     ... and ${missing.length - 20} more`);
             }
             if (empty.length > 0) {
-                console.log(`  ⚠️  Empty values (${empty.length}):`);
-                empty.slice(0, 20).forEach(key => console.log(`     - ${key}`));
-                if (empty.length > 20) console.log(`     ... and ${empty.length - 20} more`);
+                log(`  ⚠️  Empty values (${empty.length}):`);
+                log(empty.slice(0, 20).map(key => `     - ${key}`).join('\n'));
+                if (empty.length > 20) log(`     ... and ${empty.length - 20} more`);
             }
             if (untranslated.length > 0) {
-                console.log(`  ⚠️  Untranslated (same as EN) (${untranslated.length}):`);
-                untranslated.slice(0, 20).forEach(key => console.log(`     - ${key}`));
-                if (untranslated.length > 20) console.log(`     ... and ${untranslated.length - 20} more`);
+                log(`  ⚠️  Untranslated (same as EN) (${untranslated.length}):`);
+                log(untranslated.slice(0, 20).map(key => `     - ${key}`).join('\n'));
+                if (untranslated.length > 20) log(`     ... and ${untranslated.length - 20} more`);
             }
             if (keyLikeValues.length > 0) {
-                console.log(`  🚨 KEY-LIKE VALUES (looks like translation keys) (${keyLikeValues.length}):`);
-                keyLikeValues.forEach(({ key, value }) => console.log(`     - ${key}: "${value}"`));
+                log(`  🚨 KEY-LIKE VALUES (looks like translation keys) (${keyLikeValues.length}):`);
+                log(keyLikeValues.map(({ key, value }) => `     - ${key}: "${value}"`).join('\n'));
             }
-            console.log('');
+            log('');
             
             allIssues.push({
                 locale,
@@ -216,7 +299,7 @@ function checkJsonTranslations() {
                 keyLikeValues,
             });
         } else {
-            console.log(`✅ ${locale.toUpperCase()}: All translations present\n`);
+            log(`✅ ${locale.toUpperCase()}: All translations present\n`);
         }
     });
     
@@ -226,206 +309,283 @@ function checkJsonTranslations() {
 
 // Check diet programs from database (requires DB connection)
 async function checkDietPrograms() {
-    console.log('🍎 Checking Diet Programs translations...\n');
+    log('🍎 Checking Diet Programs translations...\n');
     
     // This would require Prisma client - for now, we'll provide instructions
-    console.log('⚠️  To check diet programs from database, run:');
-    console.log('   node scripts/check-db-translations.js\n');
-    console.log('   Or use the API endpoint to fetch diets and check their translations\n');
+    log('⚠️  To check diet programs from database, run:');
+    log('   node scripts/check-db-translations.js\n');
+    log('   Or use the API endpoint to fetch diets and check their translations\n');
     
     return { issues: [], totalIssues: 0 };
 }
 
-// Check code for potential issues
-function checkCodeUsage() {
-    console.log('🔍 Checking code for translation issues...\n');
+// The same t() keys show up in many files; remember each key's verdict
+const technicalKeyCache = new Map();
+
+// Helper: Whether a t() argument is a technical string rather than a translation key
+function isTechnicalKey(key) {
+    let result = technicalKeyCache.get(key);
+    if (result !== undefined) return result;
     
+    // FIX: Ignore obvious non-translation keys:
+    // - Single characters or symbols (".", ",", "-", "@", "T")
+    // - Escape sequences ("\n", "\t", "\r", etc.)
+    // - URLs or paths ("/auth/apple", "/v1/health", "/diets/active/today")
+    // - HTTP methods ("GET", "PUT", "DELETE", "HEAD")
+    // - Technical strings ("window")
+    // - Emojis ("🎉")
+    // FIX: Check for escape sequences more accurately
+    // Escape sequences in JavaScript strings: \n, \t, \r, \b, \f, \v, \', \", \\, \0, \xHH, \uHHHH
+    // Note: In the regex match, escape sequences appear as literal "\n" (backslash + n), not actual newline
+    const isEscapeSequence = ESCAPE_SEQUENCE_RE.test(key);
+
+    result =
+        (key.length <= 1 && !isEscapeSequence) || // Single char (but not escape sequences)
+        isEscapeSequence || // Escape sequences: \n, \t, \r, etc.
+        key.startsWith('/') || // URL/path
+        /^(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)$/i.test(key) || // HTTP methods
+        key === 'window' || // Technical
+        /^[\u{1F300}-\u{1F9FF}]$/u.test(key); // Emoji
+    
+    technicalKeyCache.set(key, result);
+    return result;
+}
+
+// Scan one source file for translation issues. It reads into the module-level
+// scanBuffer and fills the module-level caches (technicalKeyCache, parsed
+// locales, key path sets), so it is not reentrant: call it one file at a time
+// per thread. Each worker thread loads its own copy of this module, and with
+// it its own buffer and caches, which is what keeps the worker fan-out safe.
+function scanFile(file, srcDir) {
     const issues = [];
-    const srcDir = path.join(__dirname, '../apps/mobile/src');
     
-    // Find all JS/TS/TSX files
-    function findFiles(dir, ext = ['.js', '.ts', '.tsx']) {
-        let results = [];
-        const list = fs.readdirSync(dir);
-        list.forEach(file => {
-            const filePath = path.join(dir, file);
-            const stat = fs.statSync(filePath);
-            if (stat && stat.isDirectory() && !file.startsWith('.') && file !== 'node_modules') {
-                results = results.concat(findFiles(filePath, ext));
-            } else if (ext.some(e => file.endsWith(e))) {
-                results.push(filePath);
+    const relativeFile = path.relative(srcDir, file);
+    
+    // Check the size on the open descriptor so oversized generated files are
+    // skipped before any of it is read
+    let length;
+    try {
+        const fd = fs.openSync(file, 'r');
+        try {
+            const { size } = fs.fstatSync(fd);
+            if (size > MAX_SCAN_FILE_SIZE) {
+                return issues;
             }
-        });
-        return results;
+            length = readIntoScanBuffer(fd, size);
+        } finally {
+            fs.closeSync(fd);
+        }
+    } catch (error) {
+        console.warn(`   ⚠️  Could not read ${relativeFile}: ${error.message}`);
+        return issues;
     }
     
-    const files = findFiles(srcDir);
-    // FIX: Exclude test files and node_modules
-    const filteredFiles = files.filter(file => {
-        const relativePath = path.relative(srcDir, file);
-        // Exclude test files, node_modules, and build artifacts
-        return !relativePath.includes('__tests__') &&
-               !relativePath.includes('.test.') &&
-               !relativePath.includes('.spec.') &&
-               !relativePath.includes('node_modules') &&
-               !relativePath.includes('dist') &&
-               !relativePath.includes('build');
-    });
+    // Scan a latin1 view of the raw bytes (one char per byte, no UTF-8
+    // decode) for candidates and decode just the candidate lines; see
+    // CANDIDATE_SCAN_RE for how non-ASCII whitespace after t( is kept.
+    // Offsets in `content` are byte offsets into scanBuffer.
+    const content = scanBuffer.toString('latin1', 0, length);
     
-    console.log(`   Scanning ${filteredFiles.length} files (excluding tests)...\n`);
+    // Run the candidate pattern once over the whole file and only apply the
+    // per-line checks to lines where it matched. Matches arrive in offset
+    // order, so candidate lines come out sorted and only need adjacent dedup.
+    // Line starts are only indexed once a file has at least one candidate.
+    let lineStarts = null;
+    const candidateLines = [];
+    for (const match of content.matchAll(CANDIDATE_SCAN_RE)) {
+        if (!lineStarts) {
+            lineStarts = getLineStarts(scanBuffer.subarray(0, length));
+        }
+        const index = lineIndexAt(lineStarts, match.index);
+        if (candidateLines[candidateLines.length - 1] !== index) {
+            candidateLines.push(index);
+        }
+    }
     
-    filteredFiles.forEach(file => {
-        const content = fs.readFileSync(file, 'utf8');
-        const lines = content.split('\n');
-        const relativeFile = path.relative(srcDir, file);
-        
-        lines.forEach((line, index) => {
-            // Skip comments and empty lines
-            if (line.trim().startsWith('//') || line.trim().startsWith('*') || line.trim() === '') {
-                return;
-            }
+    candidateLines.forEach(index => {
+        const end = index + 1 < lineStarts.length ? lineStarts[index + 1] - 1 : content.length;
+        const line = scanBuffer.toString('utf8', lineStarts[index], end);
+        const trimmed = line.trim();
 
-            if (/^\s*import\s/.test(line) || /\bfrom\s+['"]/.test(line) || /\brequire\(\s*['"]/.test(line)) {
-                return;
-            }
+        // Skip comments and empty lines
+        if (trimmed.startsWith('//') || trimmed.startsWith('*') || trimmed === '') {
+            return;
+        }
 
-            if (
-                relativeFile === 'components/LegalDocumentView.tsx' ||
-                line.includes('Fallback:') ||
-                line.includes('titleFallback') ||
-                line.includes('descFallback') ||
-                line.includes('actionFallback') ||
-                line.includes('t = (key) =>') ||
-                /^\s*(en|ru|kk|fr|de|es):\s*['"]/.test(line)
-            ) {
-                return;
-            }
-            
-            // FIX: Skip console.log, console.error, console.warn - these are logs, not UI text
-            if (line.trim().startsWith('console.')) {
-                return;
-            }
-            
-            // Check for hardcoded strings that should be translated
-            // Pattern: Text in quotes that looks like UI text (not code/comments)
-            if (line.includes('t(') || line.includes('safeT(')) {
-                // Check if translation key is used correctly
-                const keyMatch = line.match(/\b(?:t|safeT)\(\s*['"]([^'"]+)['"]/);
-                if (keyMatch) {
-                    const key = keyMatch[1];
-                    
-                    // FIX: Ignore obvious non-translation keys:
-                    // - Single characters or symbols (".", ",", "-", "@", "T")
-                    // - Escape sequences ("\n", "\t", "\r", etc.)
-                    // - URLs or paths ("/auth/apple", "/v1/health", "/diets/active/today")
-                    // - HTTP methods ("GET", "PUT", "DELETE", "HEAD")
-                    // - Technical strings ("window")
-                    // - Emojis ("🎉")
-                    // FIX: Check for escape sequences more accurately
-                    // Escape sequences in JavaScript strings: \n, \t, \r, \b, \f, \v, \', \", \\, \0, \xHH, \uHHHH
-                    // Note: In the regex match, escape sequences appear as literal "\n" (backslash + n), not actual newline
-                    const isEscapeSequence = /^\\[nrtbfv'"\\0]/.test(key) || 
-                                           /^\\x[0-9a-fA-F]{2}$/.test(key) || 
-                                           /^\\u[0-9a-fA-F]{4}$/.test(key);
-                    
-                    const isTechnicalString = 
-                        (key.length <= 1 && !isEscapeSequence) || // Single char (but not escape sequences)
-                        isEscapeSequence || // Escape sequences: \n, \t, \r, etc.
-                        key.startsWith('/') || // URL/path
-                        /^(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)$/i.test(key) || // HTTP methods
-                        key === 'window' || // Technical
-                        /^[\u{1F300}-\u{1F9FF}]$/u.test(key); // Emoji
-                    
-                    if (isTechnicalString) {
-                        return; // Skip technical strings
-                    }
-                    
-                    // Check if key exists in English translations
-                    const enPath = path.join(LOCALES_DIR, 'en.json');
-                    if (fs.existsSync(enPath)) {
-                        const enContent = JSON.parse(fs.readFileSync(enPath, 'utf8'));
-                        if (!hasKey(enContent, key)) {
-                            issues.push({
-                                file: path.relative(srcDir, file),
-                                line: index + 1,
-                                issue: `Translation key "${key}" not found in en.json`,
-                                severity: 'error',
-                            });
-                        }
-                    }
-                }
-            }
-            
-            // Check for hardcoded English text that should be translated
-            // This is a heuristic - look for common UI patterns
-            // FIX: More strict pattern - only flag if it's clearly UI text, not test data or code
-            const uiTextPattern = /['"](Save|Cancel|Delete|Edit|Close|Back|Next|Continue|Loading|Error|Success|Try Again|Share|Correct)[^'"]*['"]/;
-            if (uiTextPattern.test(line)) {
-                // But ignore if it's in a comment, already using t(), or in a test/describe/it block
-                const isInTest = line.includes('test(') || line.includes('it(') || line.includes('describe(') || 
-                                line.includes('expect(') || line.includes('render(') || line.includes('screen.');
-                
-                // FIX: Ignore accessibility labels and technical attributes
-                const isAccessibilityAttr = line.includes('accessibilityLabel') || 
-                                          line.includes('accessibilityHint') ||
-                                          line.includes('testID') ||
-                                          line.includes('accessibilityRole');
-                
-                // FIX: Ignore fallback values in || expressions (e.g., `content.button_cancel || 'Cancel'`)
-                const isFallbackValue = /['"](Save|Cancel|Delete|Edit|Close|Back|Next|Continue|Loading|Error|Success|Try Again|Share|Correct)[^'"]*['"]\s*\|\|/.test(line) ||
-                                       /\|\|\s*['"](Save|Cancel|Delete|Edit|Close|Back|Next|Continue|Loading|Error|Success|Try Again|Share|Correct)[^'"]*['"]/.test(line);
+        if (MODULE_LINE_RE.test(line)) {
+            return;
+        }
+
+        if (
+            relativeFile === 'components/LegalDocumentView.tsx' ||
+            FALLBACK_LINE_RE.test(line) ||
+            LOCALE_LITERAL_RE.test(line)
+        ) {
+            return;
+        }
+        
+        // FIX: Skip console.log, console.error, console.warn - these are logs, not UI text
+        if (trimmed.startsWith('console.')) {
+            return;
+        }
+        
+        const hasTCall = line.includes('t(') || line.includes('safeT(');
+        
+        // Check for hardcoded strings that should be translated
+        // Pattern: Text in quotes that looks like UI text (not code/comments)
+        if (hasTCall) {
+            // Check if translation key is used correctly
+            const keyMatch = line.match(T_KEY_RE);
+            if (keyMatch) {
+                const key = keyMatch[1];
                 
-                // FIX: Ignore if it's in a console statement or error handling
-                const isInErrorHandling = line.includes('console.') || 
-                                         line.includes('catch') ||
-                                         line.includes('throw');
+                if (isTechnicalKey(key)) {
+                    return; // Skip technical strings
+                }
                 
-                if (!line.trim().startsWith('//') && 
-                    !line.includes('t(') && 
-                    !line.includes('safeT(') &&
-                    !isInTest &&
-                    !isAccessibilityAttr &&
-                    !isFallbackValue &&
-                    !isInErrorHandling) {
-                    issues.push({
-                        file: path.relative(srcDir, file),
-                        line: index + 1,
-                        issue: `Possible hardcoded text: ${line.trim().substring(0, 60)}`,
-                        severity: 'warning',
-                    });
+                // Check if key exists in English translations
+                const enContent = readLocaleFile(EN_LOCALE_PATH);
+                if (enContent) {
+                    if (!getLocaleKeyPaths(enContent).has(key)) {
+                        issues.push({
+                            file: relativeFile,
+                            line: index + 1,
+                            issue: `Translation key "${key}" not found in en.json`,
+                            severity: 'error',
+                        });
+                    }
                 }
             }
-        });
+        }
+        
+        // Check for hardcoded English text that should be translated
+        // This is a heuristic - look for common UI patterns
+        // FIX: More strict pattern - only flag if it's clearly UI text, not test data or code
+        // Cheapest rejection first (comments were already skipped above), and
+        // each exclusion regex only runs while the line is still a candidate
+        if (!hasTCall &&
+            UI_TEXT_RE.test(line) &&
+            // But ignore if it's in a test/describe/it block
+            !TEST_CALL_RE.test(line) &&
+            // FIX: Ignore accessibility labels and technical attributes
+            !ACCESSIBILITY_ATTR_RE.test(line) &&
+            // FIX: Ignore fallback values in || expressions (e.g., `content.button_cancel || 'Cancel'`)
+            !UI_TEXT_FALLBACK_RE.test(line) &&
+            // FIX: Ignore if it's in a console statement or error handling
+            !ERROR_HANDLING_RE.test(line)) {
+            issues.push({
+                file: relativeFile,
+                line: index + 1,
+                issue: `Possible hardcoded text: ${trimmed.substring(0, 60)}`,
+                severity: 'warning',
+            });
+        }
     });
     
+    return issues;
+}
+
+// Check code for potential issues
+async function checkCodeUsage() {
+    log('🔍 Checking code for translation issues...\n');
+    
+    const srcDir = path.join(__dirname, '../apps/mobile/src');
+    
+    // Find all JS/TS/TSX files
+    // Iterative walk over Dirent entries: no statSync per file, and noise
+    // directories are pruned before we ever descend into them.
+    function findFiles(root) {
+        const results = [];
+        const stack = [{ filePath: root, isDirectory: true }];
+        while (stack.length > 0) {
+            const { filePath, isDirectory } = stack.pop();
+            if (!isDirectory) {
+                results.push(filePath);
+                continue;
+            }
+            // Each directory's entries are visited in name order, depth-first,
+            // like a recursive walk (so `Foo/index.tsx` still comes before
+            // `Foo-Bar.tsx`); they're pushed in reverse so they pop in order
+            const entries = fs.readdirSync(filePath, { withFileTypes: true })
+                .sort((a, b) => (a.name < b.name ? -1 : a.name > b.name ? 1 : 0));
+            for (let i = entries.length - 1; i >= 0; i--) {
+                const entry = entries[i];
+                const entryPath = path.join(filePath, entry.name);
+                if (entry.isDirectory()) {
+                    if (!entry.name.startsWith('.') && !SKIP_DIRS.has(entry.name)) {
+                        stack.push({ filePath: entryPath, isDirectory: true });
+                    }
+                } else if (SOURCE_FILE_RE.test(entry.name) && !EXCLUDED_FILE_RE.test(entry.name)) {
+                    stack.push({ filePath: entryPath, isDirectory: false });
+                }
+            }
+        }
+        return results;
+    }
+    
+    // FIX: Exclude test files (test files are dropped and test/build
+    // directories pruned while findFiles walks, no second pass over the list)
+    const filteredFiles = findFiles(srcDir);
+    
+    log(`   Scanning ${filteredFiles.length} files (excluding tests)...\n`);
+    
+    const issues = filteredFiles.length >= PARALLEL_SCAN_MIN_FILES
+        // Chunk results come back in chunk order, so the report order is unchanged
+        ? (await runInWorkers(__filename, filteredFiles, { srcDir })).flat()
+        : filteredFiles.flatMap(file => scanFile(file, srcDir));
+    
     if (issues.length > 0) {
-        console.log(`   Found ${issues.length} potential issues:\n`);
-        issues.forEach(issue => {
+        log(`   Found ${issues.length} potential issues:\n`);
+        // One write for the whole report instead of two log calls per issue
+        log(issues.map(issue => {
             const icon = issue.severity === 'error' ? '❌' : '⚠️';
-            console.log(`   ${icon} ${issue.file}:${issue.line}`);
-            console.log(`      ${issue.issue}\n`);
-        });
+            return `   ${icon} ${issue.file}:${issue.line}\n      ${issue.issue}\n`;
+        }).join('\n'));
     } else {
-        console.log('   ✅ No obvious translation issues found in code\n');
+        log('   ✅ No obvious translation issues found in code\n');
     }
     
     return { issues, totalIssues: issues.length };
 }
 
+// Flatten check results into one JSON record per issue
+function toJsonRecords(jsonResults, codeResults) {
+    const records = [];
+    jsonResults.issues.forEach(({ locale, type, missing, empty, untranslated, keyLikeValues }) => {
+        if (type === 'missing_file') {
+            records.push({ kind: 'locale', locale, type });
+            return;
+        }
+        missing.forEach(key => records.push({ kind: 'locale', locale, type: 'missing', key }));
+        empty.forEach(key => records.push({ kind: 'locale', locale, type: 'empty', key }));
+        untranslated.forEach(key => records.push({ kind: 'locale', locale, type: 'untranslated', key }));
+        keyLikeValues.forEach(({ key, value }) => records.push({ kind: 'locale', locale, type: 'key_like', key, value }));
+    });
+    codeResults.issues.forEach(issue => records.push({ kind: 'code', ...issue }));
+    return records;
+}
+
 // Main function
 async function main() {
-    console.log('🔍 Comprehensive Translation Checker\n');
-    console.log('='.repeat(60) + '\n');
+    log('🔍 Comprehensive Translation Checker\n');
+    log('='.repeat(60) + '\n');
     
     const jsonResults = checkJsonTranslations();
-    const codeResults = checkCodeUsage();
+    const codeResults = await checkCodeUsage();
     const dbResults = await checkDietPrograms();
     
-    console.log('='.repeat(60));
-    console.log('\n📊 Summary:\n');
-    console.log(`   JSON Translation Issues: ${jsonResults.totalIssues}`);
-    console.log(`   Code Usage Issues: ${codeResults.totalIssues}`);
-    console.log(`   Database Issues: ${dbResults.totalIssues} (requires separate check)\n`);
+    if (JSON_OUTPUT) {
+        const records = toJsonRecords(jsonResults, codeResults);
+        if (records.length > 0) {
+            process.stdout.write(records.map(record => JSON.stringify(record)).join('\n') + '\n');
+        }
+    }
+    
+    log('='.repeat(60));
+    log('\n📊 Summary:\n');
+    log(`   JSON Translation Issues: ${jsonResults.totalIssues}`);
+    log(`   Code Usage Issues: ${codeResults.totalIssues}`);
+    log(`   Database Issues: ${dbResults.totalIssues} (requires separate check)\n`);
     
     // Total issues (informational, not used for exit code)
     // const totalIssues = jsonResults.totalIssues + codeResults.totalIssues;
@@ -441,23 +601,32 @@ async function main() {
     const realTotalIssues = jsonResults.totalIssues + realIssues.length;
     
     if (realTotalIssues === 0) {
-        console.log('✅ All translations are complete!');
-        console.log('\n⚠️  Note: Database translations (diets/lifestyles) require separate check');
-        console.log('   Run: pnpm run i18n:check-db\n');
+        log('✅ All translations are complete!');
+        log('\n⚠️  Note: Database translations (diets/lifestyles) require separate check');
+        log('   Run: pnpm run i18n:check-db\n');
     } else {
-        console.log(`❌ Found ${realTotalIssues} real translation issues!`);
-        console.log(`   (Ignored ${codeResults.totalIssues - realIssues.length} test file warnings)`);
+        log(`❌ Found ${realTotalIssues} real translation issues!`);
+        log(`   (Ignored ${codeResults.totalIssues - realIssues.length} test file warnings)`);
         if (realIssues.length > 0) {
-            console.log('\n   Real issues (non-test files):');
-            realIssues.forEach(issue => {
-                console.log(`   ❌ ${issue.file}:${issue.line} - ${issue.issue}`);
-            });
+            log('\n   Real issues (non-test files):');
+            log(realIssues.map(issue => `   ❌ ${issue.file}:${issue.line} - ${issue.issue}`).join('\n'));
+        }
+        if (JSON_OUTPUT) {
+            // stdout is usually a pipe here, and pipe writes can still be
+            // pending (async on macOS); let the process exit on its own once
+            // they've flushed instead of truncating the JSONL
+            process.exitCode = 1;
+            return;
         }
         process.exit(1);
     }
 }
 
-main().catch(error => {
-    console.error('Error:', error);
-    process.exit(1);
-});
+if (isMainThread) {
+    main().catch(error => {
+        console.error('Error:', error);
+        process.exit(1);
+    });
+} else {
+    parentPort.postMessage(workerData.files.flatMap(file => scanFile(file, workerData.srcDir)));
+}
@@ -1,53 +1,46 @@
-const fs = require('fs');
 const path = require('path');
+const { getKeys, MISSING, getValueAtPath, readLocaleFile } = require('./i18n-locale-utils');
 
 const LOCALES_DIR = path.join(__dirname, '../apps/mobile/app/i18n/locales');
 const TARGET_LOCALES = ['ru', 'kk', 'fr'];
 
-// Helper: Get all keys from nested object
-function getKeys(obj, prefix = '') {
-    return Object.keys(obj).reduce((acc, key) => {
-        const value = obj[key];
-        const fullKey = prefix ? `${prefix}.${key}` : key;
-        if (value && typeof value === 'object' && !Array.isArray(value)) {
-            acc.push(...getKeys(value, fullKey));
-        } else {
-            acc.push(fullKey);
-        }
-        return acc;
-    }, []);
-}
-
-// Helper: Get value from nested object by key path
-function getValue(obj, key) {
-    return key.split('.').reduce((o, i) => (o ? o[i] : undefined), obj);
-}
-
-// Helper: Check if key exists in object
-function hasKey(obj, key) {
-    return getValue(obj, key) !== undefined;
-}
+// International terms that are the same in multiple languages
+const IGNORE_SAME_AS_ENGLISH = new Set([
+    'EatSense', 'OK', 'Email', 'ID', 'v1.0', 'All', 'Auto', 'Snack',
+    'Premium', 'Pro', 'Free', 'Articles', 'Article', 'calories', 'kcal',
+    'Total', 'Dashboard', 'Profile', 'Settings', 'Cancel', 'Save', 'Delete',
+    'Edit', 'Close', 'Back', 'Next', 'Skip', 'Done', 'Loading', 'Error',
+    'Success', 'Retry', 'Search', 'View All', 'Yes', 'No', 'Confirm', 'Info',
+    'Days', 'Of', 'Coming Soon', 'Continue', 'Show', 'Hide', 'Hours', 'Stop',
+    'Go Back', 'Go To', 'Days Ago', 'Got It', 'Later', 'Other', 'Yesterday',
+    'Notifications', 'Student', 'Founder', 'Chat', 'Expert', 'Client', 'Consultation',
+    'Description', 'Spam', 'Pause', 'Contact', 'Title', 'Link', 'Excellent',
+    'Performance', 'Required', 'Grant Access', 'Enabled', 'Not Enabled', 'Enable Failed',
+    'Vintage', 'Destinations', 'Modal Title', 'Diets', 'Experts', 'Reports',
+    'Calories', 'Zoom Label', 'Flash Mode Auto', 'Flash auto', 'Flash automatique', 'Today', 'Empty', 'Times', 'Period',
+    'Adherence', 'Conclusions', 'On Track', 'Over', 'Under', 'Subtitle', 'Download Current',
+    'History', 'Downloaded', 'No Data For Month', 'Delete Confirm', 'File Saved',
+    'Privacy Title', 'Terms Title', 'Privacy Link', 'Terms Link', 'Tab Title',
+    'Load', 'Name Required', 'No Doses', 'Add',
+    'Delete Message', 'Name', 'Dosage', 'Instructions', 'Start Date', 'End Date',
+    'Timezone', 'Doses', 'Before Meal', 'After Meal', 'Add Dose', 'Health Score Label',
+    'Daily Limit Reached', 'No Data Today', 'Unnamed Product', 'Chronotype', 'Inflammation',
+    'Suggestions', 'Nutrition', 'Support', 'Assistance', 'Medications', 'Médicaments', 'Medication schedule', 'Planning des médicaments', '500 mg',
+    'Zoom {{value}}x', 'Calories (kcal)', 'EatSense Pro', 'EatSense Premium', '9. Contact', '10. Contact',
+    'Horaires', 'Old Money', 'Hot Girl Walk', 'Normal', 'Hypertension', 'Allergies', 'Stress',
+    'Liraglutide', 'Microbiome', 'Sports', 'Brunch', 'Discipline', 'Disco', 'Flexible',
+    'Gatsby', 'Glamour', 'Hollywood', 'Kazakh', 'Macros', 'Simple', 'Social',
+    'Notes', 'Photo', 'Portions', 'Soft Life', 'Mob Wife', 'Summer Shred',
+    'Portugal', 'Digestion',
+]);
+
+// Keys related to Nutrition section: diets_, diets., lifestyles., dietPrograms.
+// One anchored alternation instead of a startsWith() per prefix per key
+const NUTRITION_KEY_RE = /^(?:diets[_.]|lifestyles\.|dietPrograms\.)/;
 
 // Check Nutrition section keys
-function getNutritionKeys(enContent) {
-    const nutritionKeys = [];
-    const allKeys = getKeys(enContent);
-
-    // Keys related to Nutrition section
-    const nutritionPrefixes = [
-        'diets_',
-        'diets.',
-        'lifestyles.',
-        'dietPrograms.',
-    ];
-
-    allKeys.forEach(key => {
-        if (nutritionPrefixes.some(prefix => key.startsWith(prefix))) {
-            nutritionKeys.push(key);
-        }
-    });
-
-    return nutritionKeys;
+function getNutritionEntries(enEntries) {
+    return enEntries.filter(({ key }) => NUTRITION_KEY_RE.test(key));
 }
 
 function main() {
@@ -55,8 +48,18 @@ function main() {
 
     // Load English as reference
     const enPath = path.join(LOCALES_DIR, 'en.json');
-    const enContent = JSON.parse(fs.readFileSync(enPath, 'utf8'));
+    const enContent = readLocaleFile(enPath);
+    if (!enContent) {
+        console.error('❌ English translation file not found!');
+        process.exit(1);
+    }
     const enKeys = getKeys(enContent);
+    // Split every key path once and resolve its English value once, instead
+    // of re-splitting and re-walking en.json for every target locale
+    const enEntries = enKeys.map(key => {
+        const parts = key.split('.');
+        return { key, parts, enValue: getValueAtPath(enContent, parts) };
+    });
 
     console.log(`📊 Total keys in English: ${enKeys.length}\n`);
 
@@ -67,57 +70,26 @@ function main() {
     // Check each target locale
     TARGET_LOCALES.forEach(locale => {
         const localePath = path.join(LOCALES_DIR, `${locale}.json`);
-        if (!fs.existsSync(localePath)) {
+        const localeContent = readLocaleFile(localePath);
+        if (!localeContent) {
             console.log(`❌ ${locale.toUpperCase()}: File not found\n`);
             return;
         }
 
-        const localeContent = JSON.parse(fs.readFileSync(localePath, 'utf8'));
         const missing = [];
         const empty = [];
         const untranslated = [];
 
-        enKeys.forEach(key => {
-            if (!hasKey(localeContent, key)) {
+        enEntries.forEach(({ key, parts, enValue }) => {
+            const value = getValueAtPath(localeContent, parts);
+            if (value === MISSING) {
                 missing.push(key);
             } else {
-                const value = getValue(localeContent, key);
-                const enValue = getValue(enContent, key);
-
                 if (value === '' || value === null || value === undefined) {
                     empty.push(key);
                 } else if (typeof value === 'string' && typeof enValue === 'string' && value === enValue && value.length > 3) {
                     // Check if it's not a brand name or common term
-                    // International terms that are the same in multiple languages
-                    const ignoreList = [
-                        'EatSense', 'OK', 'Email', 'ID', 'v1.0', 'All', 'Auto', 'Snack',
-                        'Premium', 'Pro', 'Free', 'Articles', 'Article', 'calories', 'kcal',
-                        'Total', 'Dashboard', 'Profile', 'Settings', 'Cancel', 'Save', 'Delete',
-                        'Edit', 'Close', 'Back', 'Next', 'Skip', 'Done', 'Loading', 'Error',
-                        'Success', 'Retry', 'Search', 'View All', 'Yes', 'No', 'Confirm', 'Info',
-                        'Days', 'Of', 'Coming Soon', 'Continue', 'Show', 'Hide', 'Hours', 'Stop',
-                        'Go Back', 'Go To', 'Days Ago', 'Free', 'Got It', 'Later', 'Other', 'Yesterday',
-                        'Notifications', 'Student', 'Founder', 'Chat', 'Expert', 'Client', 'Consultation',
-                        'Description', 'Spam', 'Pause', 'Contact', 'Title', 'Link', 'Excellent',
-                        'Performance', 'Required', 'Grant Access', 'Enabled', 'Not Enabled', 'Enable Failed',
-                        'Vintage', 'Destinations', 'Modal Title', 'Diets', 'Experts', 'Reports',
-                        'Calories', 'Zoom Label', 'Flash Mode Auto', 'Flash auto', 'Flash automatique', 'Today', 'Empty', 'Times', 'Period',
-                        'Adherence', 'Conclusions', 'On Track', 'Over', 'Under', 'Subtitle', 'Download Current',
-                        'History', 'Downloaded', 'No Data For Month', 'Delete Confirm', 'File Saved',
-                        'Privacy Title', 'Terms Title', 'Privacy Link', 'Terms Link', 'Tab Title',
-                        'Load', 'Save', 'Delete', 'Name Required', 'No Doses', 'Edit', 'Add',
-                        'Delete Message', 'Name', 'Dosage', 'Instructions', 'Start Date', 'End Date',
-                        'Timezone', 'Doses', 'Before Meal', 'After Meal', 'Add Dose', 'Health Score Label',
-                        'Daily Limit Reached', 'No Data Today', 'Unnamed Product', 'Chronotype', 'Inflammation',
-                        'Suggestions', 'Nutrition', 'Support', 'Assistance', 'Medications', 'Médicaments', 'Medication schedule', 'Planning des médicaments', '500 mg',
-                        'Zoom {{value}}x', 'Calories (kcal)', 'EatSense Pro', 'EatSense Premium', '9. Contact', '10. Contact',
-                        'Horaires', 'Times', 'Old Money', 'Hot Girl Walk', 'Normal', 'Hypertension', 'Allergies', 'Stress',
-                        'Liraglutide', 'Microbiome', 'Sports', 'Brunch', 'Discipline', 'Disco', 'Flexible',
-                        'Gatsby', 'Glamour', 'Hollywood', 'Kazakh', 'Macros', 'Simple', 'Social',
-                        'Notes', 'Photo', 'Portions', 'Soft Life', 'Mob Wife', 'Summer Shred',
-                        'Portugal', 'Digestion'
-                    ];
-                    if (!ignoreList.includes(value)) {
+                    if (!IGNORE_SAME_AS_ENGLISH.has(value)) {
                         untranslated.push(key);
                     }
                 }
@@ -134,15 +106,15 @@ function main() {
             console.log(`📋 ${locale.toUpperCase()} Issues:`);
             if (missing.length > 0) {
                 console.log(`  ❌ Missing keys (${missing.length}):`);
-                missing.forEach(key => console.log(`     - ${key}`));
+                console.log(missing.map(key => `     - ${key}`).join('\n'));
             }
             if (empty.length > 0) {
                 console.log(`  ⚠️  Empty values (${empty.length}):`);
-                empty.forEach(key => console.log(`     - ${key}`));
+                console.log(empty.map(key => `     - ${key}`).join('\n'));
             }
             if (untranslated.length > 0) {
                 console.log(`  ⚠️  Translation keys (not translated) (${untranslated.length}):`);
-                untranslated.forEach(key => console.log(`     - ${key}`));
+                console.log(untranslated.map(key => `     - ${key}`).join('\n'));
             }
             console.log('');
         }
@@ -150,23 +122,25 @@ function main() {
 
     // Check Nutrition section specifically
     console.log('🍎 Nutrition Section Check:');
-    const nutritionKeys = getNutritionKeys(enContent);
-    console.log(`   Total Nutrition keys: ${nutritionKeys.length}`);
+    const nutritionEntries = getNutritionEntries(enEntries);
+    console.log(`   Total Nutrition keys: ${nutritionEntries.length}`);
 
     TARGET_LOCALES.forEach(locale => {
         const localePath = path.join(LOCALES_DIR, `${locale}.json`);
-        if (!fs.existsSync(localePath)) {
+        const localeContent = readLocaleFile(localePath);
+        if (!localeContent) {
             return;
         }
 
-        const localeContent = JSON.parse(fs.readFileSync(localePath, 'utf8'));
-        const missingNutrition = nutritionKeys.filter(key => !hasKey(localeContent, key));
+        const missingNutrition = nutritionEntries
+            .filter(({ parts }) => getValueAtPath(localeContent, parts) === MISSING)
+            .map(({ key }) => key);
 
         if (missingNutrition.length === 0) {
             console.log(`   ✅ ${locale.toUpperCase()} Nutrition: All keys present`);
         } else {
             console.log(`   ❌ ${locale.toUpperCase()} Nutrition: Missing ${missingNutrition.length} keys`);
-            missingNutrition.forEach(key => console.log(`      - ${key}`));
+            console.log(missingNutrition.map(key => `      - ${key}`).join('\n'));
         }
     });
     console.log('');
@@ -3,6 +3,9 @@
 
 const fs = require('fs');
 const path = require('path');
+const { isMainThread, parentPort, workerData } = require('worker_threads');
+const { PARALLEL_SCAN_MIN_FILES, runInWorkers } = require('./scan-workers');
+const { getKeys } = require('./i18n-locale-utils');
 
 const PROJECT_ROOT = path.resolve(__dirname, '..');
 const MOBILE_ROOT = path.join(PROJECT_ROOT, 'apps', 'mobile');
@@ -12,61 +15,118 @@ const EN_LOCALE_PATH = path.join(MOBILE_ROOT, 'app', 'i18n', 'locales', 'en.json
 
 const KEY_REGEX = /(?:^|[^\w])t\(\s*(["'`])([^"'`]+)\1/g;
 const VALID_KEY_REGEX = /^[A-Za-z0-9_.:-]+$/;
+// A t( followed by a non-ASCII byte, possibly after ASCII whitespace
+const NON_ASCII_AFTER_T_CALL_REGEX = /t\([\t\n\v\f\r ]*[\x80-\xff]/;
+const SOURCE_EXTENSIONS = ['.js', '.jsx', '.ts', '.tsx'];
+// Only dependencies are pruned (plus dot-directories such as .git/.expo):
+// any t() call elsewhere - in tests, platform folders like screens/android,
+// ... - still counts as key usage, so skipping it would report used keys as
+// unused
+const SKIP_DIRS = new Set(['node_modules']);
 
-const flattenKeys = (obj, prefix = '') => {
-  return Object.keys(obj).reduce((acc, key) => {
-    const value = obj[key];
-    const nextKey = prefix ? `${prefix}.${key}` : key;
-    if (value && typeof value === 'object' && !Array.isArray(value)) {
-      acc.push(...flattenKeys(value, nextKey));
-    } else {
-      acc.push(nextKey);
-    }
-    return acc;
-  }, []);
-};
+const isSourceFile = (name) => SOURCE_EXTENSIONS.some((ext) => name.endsWith(ext));
 
-const walkFiles = (entry, files = []) => {
-  if (!fs.existsSync(entry)) return files;
-  const stats = fs.statSync(entry);
-  if (stats.isDirectory()) {
-    for (const item of fs.readdirSync(entry)) {
-      walkFiles(path.join(entry, item), files);
+// Iterative walk over Dirent entries: readdir already reports each entry's
+// type, so there is no existsSync/statSync per file and skipped directories
+// are never opened. `root` may also be a single file (e.g. App.tsx).
+const walkFiles = (root, files = []) => {
+  const rootStats = fs.statSync(root, { throwIfNoEntry: false });
+  if (!rootStats) return files;
+  if (!rootStats.isDirectory()) {
+    if (rootStats.isFile() && isSourceFile(path.basename(root))) {
+      files.push(root);
     }
-  } else if (stats.isFile()) {
-    const ext = path.extname(entry);
-    if (['.js', '.jsx', '.ts', '.tsx'].includes(ext)) {
-      files.push(entry);
+    return files;
+  }
+
+  const stack = [root];
+  while (stack.length > 0) {
+    const dir = stack.pop();
+    for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+      const entryPath = path.join(dir, entry.name);
+      if (entry.isDirectory()) {
+        if (!entry.name.startsWith('.') && !SKIP_DIRS.has(entry.name)) {
+          stack.push(entryPath);
+        }
+      } else if (entry.isFile() && isSourceFile(entry.name)) {
+        files.push(entryPath);
+      }
     }
   }
   return files;
 };
 
-const collectKeysFromSource = () => {
-  const files = SOURCE_DIRS.flatMap((entry) => walkFiles(entry, []));
-  const keys = new Set();
-
-  for (const filePath of files) {
-    const content = fs.readFileSync(filePath, 'utf8');
-    let match;
-    while ((match = KEY_REGEX.exec(content)) !== null) {
-      const key = match[2];
-      if (key && VALID_KEY_REGEX.test(key)) {
-        keys.add(key);
-      }
+// Adds the keys found in `filePath` to `keys`. Collecting straight into a
+// Set de-duplicates repeated keys as they are found instead of afterwards.
+const extractKeysFromFile = (filePath, keys) => {
+  const source = fs.readFileSync(filePath);
+  // Every KEY_REGEX match contains a literal "t(", so files without one skip
+  // the latin1 view and the regex pass entirely
+  if (source.indexOf('t(') === -1) {
+    return keys;
+  }
+  // VALID_KEY_REGEX only accepts ASCII keys, so a latin1 view of the raw
+  // bytes (no UTF-8 decode, one byte per char) finds the same keys as the
+  // decoded source - except that KEY_REGEX's \s* also matches non-ASCII
+  // whitespace (NBSP, U+2009, ...) after t(, which latin1 turns into
+  // multi-byte garbage. Files with a non-ASCII byte after a t( are decoded.
+  let content = source.toString('latin1');
+  if (NON_ASCII_AFTER_T_CALL_REGEX.test(content)) {
+    content = source.toString('utf8');
+  }
+  let match;
+  while ((match = KEY_REGEX.exec(content)) !== null) {
+    const key = match[2];
+    if (key && VALID_KEY_REGEX.test(key)) {
+      keys.add(key);
     }
   }
+  return keys;
+};
+
+const extractKeysFromFiles = (files, keys = new Set()) => {
+  files.forEach((filePath) => extractKeysFromFile(filePath, keys));
+  return keys;
+};
+
+const collectKeysFromSource = async () => {
+  const files = SOURCE_DIRS.flatMap((entry) => walkFiles(entry, []));
+  const keys = files.length >= PARALLEL_SCAN_MIN_FILES
+    // Every worker posts back its chunk's distinct keys
+    ? new Set((await runInWorkers(__filename, files)).flat())
+    : extractKeysFromFiles(files);
 
   return Array.from(keys).sort();
 };
 
-const main = () => {
-  const extractedKeys = collectKeysFromSource();
+// Skip the write when only generatedAt would change, so re-running the
+// extractor on an unchanged tree doesn't touch (or git-dirty) the report
+const writeReportIfChanged = (payload) => {
+  const { generatedAt, ...next } = payload;
+  if (fs.existsSync(OUTPUT_FILE)) {
+    try {
+      const { generatedAt: previousGeneratedAt, ...previous } = JSON.parse(fs.readFileSync(OUTPUT_FILE, 'utf8'));
+      if (JSON.stringify(previous) === JSON.stringify(next)) {
+        return false;
+      }
+    } catch {
+      // Unreadable report - fall through and regenerate it
+    }
+  }
+  fs.writeFileSync(OUTPUT_FILE, JSON.stringify(payload, null, 2));
+  return true;
+};
+
+const main = async () => {
+  const extractedKeys = await collectKeysFromSource();
   const enStrings = JSON.parse(fs.readFileSync(EN_LOCALE_PATH, 'utf8'));
-  const localeKeys = flattenKeys(enStrings).sort();
+  const localeKeys = getKeys(enStrings).sort();
 
-  const missingInEn = extractedKeys.filter((key) => !localeKeys.includes(key));
-  const unusedKeys = localeKeys.filter((key) => !extractedKeys.includes(key));
+  // Set lookups instead of Array#includes: ~1.5k extracted x ~3.5k locale keys
+  const localeKeySet = new Set(localeKeys);
+  const extractedKeySet = new Set(extractedKeys);
+  const missingInEn = extractedKeys.filter((key) => !localeKeySet.has(key));
+  const unusedKeys = localeKeys.filter((key) => !extractedKeySet.has(key));
 
   const payload = {
     generatedAt: new Date().toISOString(),
@@ -77,14 +137,25 @@ const main = () => {
     extractedKeys,
   };
 
-  fs.writeFileSync(OUTPUT_FILE, JSON.stringify(payload, null, 2));
+  const written = writeReportIfChanged(payload);
 
   console.log('[i18n:extract] Completed');
   console.log(`→ Extracted keys: ${extractedKeys.length}`);
   console.log(`→ Missing in en.json: ${missingInEn.length}`);
   console.log(`→ Unused keys: ${unusedKeys.length}`);
-  console.log(`→ Report written to ${path.relative(PROJECT_ROOT, OUTPUT_FILE)}`);
+  if (written) {
+    console.log(`→ Report written to ${path.relative(PROJECT_ROOT, OUTPUT_FILE)}`);
+  } else {
+    console.log(`→ Report unchanged: ${path.relative(PROJECT_ROOT, OUTPUT_FILE)}`);
+  }
 };
 
-main();
+if (isMainThread) {
+  main().catch((error) => {
+    console.error('[i18n:extract] Failed:', error);
+    process.exit(1);
+  });
+} else {
+  parentPort.postMessage(Array.from(extractKeysFromFiles(workerData.files)));
+}
 
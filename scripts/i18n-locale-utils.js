@@ -0,0 +1,57 @@
+/**
+ * Locale JSON helpers shared by the i18n scripts (check-translations.js,
+ * check-all-translations.js, i18n-extract.js, i18n-verify.js)
+ */
+
+const fs = require('fs');
+
+// Helper: Get all keys from nested object
+function getKeys(obj, prefix = '') {
+    return Object.keys(obj).reduce((acc, key) => {
+        const value = obj[key];
+        const fullKey = prefix ? `${prefix}.${key}` : key;
+        if (value && typeof value === 'object' && !Array.isArray(value)) {
+            acc.push(...getKeys(value, fullKey));
+        } else {
+            acc.push(fullKey);
+        }
+        return acc;
+    }, []);
+}
+
+// Returned by getValueAtPath when the key is not present
+const MISSING = Symbol('missing');
+
+// Helper: Get value from nested object by an already split key path.
+// One walk answers both "is it there" and "what is it".
+function getValueAtPath(obj, parts) {
+    let current = obj;
+    for (const part of parts) {
+        if (!current) return MISSING;
+        current = current[part];
+    }
+    return current === undefined ? MISSING : current;
+}
+
+// Parsed locale files, keyed by path and reused until the file's mtime changes
+const localeCache = new Map();
+
+// Helper: Read and parse a locale JSON file, or null if it doesn't exist
+function readLocaleFile(filePath) {
+    const stats = fs.statSync(filePath, { throwIfNoEntry: false });
+    if (!stats) return null;
+    const cached = localeCache.get(filePath);
+    if (cached && cached.mtimeMs === stats.mtimeMs) {
+        return cached.content;
+    }
+    const content = JSON.parse(fs.readFileSync(filePath, 'utf8'));
+    localeCache.set(filePath, { mtimeMs: stats.mtimeMs, content });
+    return content;
+}
+
+module.exports = {
+    getKeys,
+    MISSING,
+    getValueAtPath,
+    readLocaleFile,
+};
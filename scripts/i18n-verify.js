@@ -3,39 +3,32 @@
 
 const fs = require('fs');
 const path = require('path');
+const { getKeys } = require('./i18n-locale-utils');
 
 const LOCALES_DIR = path.join(__dirname, '..', 'apps', 'mobile', 'app', 'i18n', 'locales');
 
-const flattenKeys = (obj, prefix = '') => {
-  return Object.keys(obj).reduce((acc, key) => {
-    const value = obj[key];
-    const nextKey = prefix ? `${prefix}.${key}` : key;
-    if (value && typeof value === 'object' && !Array.isArray(value)) {
-      acc.push(...flattenKeys(value, nextKey));
-    } else {
-      acc.push(nextKey);
-    }
-    return acc;
-  }, []);
-};
-
-const readLocales = () => {
+// Each locale is a separate file, so issue all reads at once and let the
+// parse/flatten of one locale overlap with the I/O of the others
+const readLocales = async () => {
   const entries = fs.readdirSync(LOCALES_DIR).filter((file) => file.endsWith('.json'));
-  return entries.reduce((acc, file) => {
-    const locale = path.basename(file, '.json');
-    const contents = JSON.parse(fs.readFileSync(path.join(LOCALES_DIR, file), 'utf8'));
-    acc[locale] = flattenKeys(contents).sort();
-    return acc;
-  }, {});
+  const parsed = await Promise.all(entries.map(async (file) => {
+    const contents = JSON.parse(await fs.promises.readFile(path.join(LOCALES_DIR, file), 'utf8'));
+    return [path.basename(file, '.json'), getKeys(contents)];
+  }));
+  return Object.fromEntries(parsed);
 };
 
-const main = () => {
-  const locales = readLocales();
+const main = async () => {
+  const locales = await readLocales();
   const base = locales.en || [];
+  const baseSet = new Set(base);
 
+  // Only the reported differences need to be in order, and they are usually a
+  // handful of keys, so sort those rather than every locale's full key list
   const results = Object.entries(locales).map(([locale, keys]) => {
-    const missing = base.filter((key) => !keys.includes(key));
-    const extra = keys.filter((key) => !base.includes(key));
+    const keySet = new Set(keys);
+    const missing = base.filter((key) => !keySet.has(key)).sort();
+    const extra = keys.filter((key) => !baseSet.has(key)).sort();
     return { locale, missing, extra };
   });
 
@@ -47,11 +40,11 @@ const main = () => {
       console.log(`Locale: ${locale}`);
       if (missing.length) {
         console.log(`  Missing keys (${missing.length}):`);
-        missing.forEach((key) => console.log(`    - ${key}`));
+        console.log(missing.map((key) => `    - ${key}`).join('\n'));
       }
       if (extra.length) {
         console.log(`  Extra keys (${extra.length}):`);
-        extra.forEach((key) => console.log(`    - ${key}`));
+        console.log(extra.map((key) => `    - ${key}`).join('\n'));
       }
     }
   }
@@ -65,5 +58,8 @@ const main = () => {
   }
 };
 
-main();
+main().catch((error) => {
+  console.error('[i18n:verify] Failed:', error);
+  process.exit(1);
+});
 
@@ -0,0 +1,39 @@
+/**
+ * Worker-thread fan-out shared by check-all-translations.js and i18n-extract.js
+ *
+ * The calling script is re-run as the worker: its non-main-thread branch reads
+ * `workerData.files`, scans them and posts back an array of results.
+ */
+
+const os = require('os');
+const { Worker } = require('worker_threads');
+
+// Below this many files, spinning up worker threads costs more than it saves
+const PARALLEL_SCAN_MIN_FILES = 1000;
+const PARALLEL_SCAN_CHUNK_SIZE = 64;
+
+// Split files into contiguous chunks, run `workerFile` on each chunk in its own
+// worker thread (workerData is { files: chunk, ...data }), and resolve with
+// each worker's posted results in chunk order
+function runInWorkers(workerFile, files, data = {}) {
+    const workerCount = Math.min(os.cpus().length, Math.ceil(files.length / PARALLEL_SCAN_CHUNK_SIZE));
+    const chunkSize = Math.ceil(files.length / workerCount);
+    const chunks = [];
+    for (let i = 0; i < files.length; i += chunkSize) {
+        chunks.push(files.slice(i, i + chunkSize));
+    }
+    return Promise.all(chunks.map(chunk => new Promise((resolve, reject) => {
+        const worker = new Worker(workerFile, { workerData: { ...data, files: chunk } });
+        worker.once('message', resolve);
+        worker.once('error', reject);
+        // A worker that exits without posting its results (process.exit in
+        // the worker, an OOM kill, ...) would otherwise leave this pending
+        // forever; after a message or an error this settles nothing
+        worker.once('exit', code => reject(new Error(`Scan worker exited with code ${code} before reporting results`)));
+    })));
+}
+
+module.exports = {
+    PARALLEL_SCAN_MIN_FILES,
+    runInWorkers,
+};